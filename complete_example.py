@@ -4,38 +4,48 @@ To run, use 'python3 complete_example.py'.
 
 This example uses the OpenMP Static scheduler to map tasks to
 resource following a round-robin and a compact fashion.
-The results in both cases are plotted.
+The scenarios are independent, so they are simulated in parallel
+processes. The results in both cases are plotted.
+To see each scheduling event, call simulate with debug=True.
 """
 
+from concurrent.futures import ProcessPoolExecutor  # for parallel runs
+
 import simulator.schedulers as schedulers
 import simulator.support as support
 from simulator.simulator import simulate
 
 
-print("Scenario 1: round-robin scheduler")
 # Setup
 num_tasks = 10
 num_resources = 3
 task_loads = [i+1 for i in range(num_tasks)]
-round_robin = schedulers.OpenMPStatic(task_loads, num_resources, 1)
-# Simulates
-result = simulate(task_loads, num_resources, round_robin, True)
-# Presents an analysis of the results
-print(f'- Calls to the scheduler: {result[2]}')
-print(f'- Changes of resources between contiguous tasks: {result[3]}')
-mapping = result[0]
-support.evaluate_mapping(mapping, task_loads, num_resources)
-# Plots the resulting mapping and saves it to a file
-support.plot_mapping(mapping, task_loads, num_resources, 'rr.png')
-
-print("Scenario 2: compact scheduler")
-compact = schedulers.OpenMPStatic(task_loads, num_resources, 0)
-# Simulates
-result = simulate(task_loads, num_resources, compact, True)
-# Presents an analysis of the results
-print(f'- Calls to the scheduler: {result[2]}')
-print(f'- Changes of resources between contiguous tasks: {result[3]}')
-mapping = result[0]
-support.evaluate_mapping(mapping, task_loads, num_resources)
-# Plots the resulting mapping and saves it to a file
-support.plot_mapping(mapping, task_loads, num_resources, 'compact.png')
+
+
+def run_scenario(chunk_size):
+    """Simulates the static scheduler with a given chunk size."""
+    scheduler = schedulers.OpenMPStatic(task_loads, num_resources, chunk_size)
+    return simulate(task_loads, num_resources, scheduler)
+
+
+if __name__ == '__main__':
+    # Name, chunk size, and plot file of each scenario
+    scenarios = [('round-robin', 1, 'rr.png'),
+                 ('compact', 0, 'compact.png')]
+
+    # Simulates all scenarios at the same time
+    with ProcessPoolExecutor(max_workers=len(scenarios)) as executor:
+        results = list(executor.map(run_scenario,
+                                    [chunk for _, chunk, _ in scenarios]))
+
+    for number, ((name, chunk, filename), result) in enumerate(
+            zip(scenarios, results), start=1):
+        print(f'Scenario {number}: {name} scheduler')
+        # Presents an analysis of the results
+        print(f'- Makespan: {result[1]}')
+        print(f'- Calls to the scheduler: {result[2]}')
+        print(f'- Changes of resources between contiguous tasks: {result[3]}')
+        mapping = result[0]
+        support.evaluate_mapping(mapping, task_loads, num_resources)
+        # Plots the resulting mapping and saves it to a file
+        support.plot_mapping(mapping, task_loads, num_resources, filename)
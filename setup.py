@@ -1,7 +1,12 @@
 "Setup file to install any missing Python3 packages if needed"
 
-try:
-    import matplotlib
-except ImportError:
-    import pip
-    pip(['install', '--user', 'matplotlib'])
+import importlib
+import subprocess
+import sys
+
+for package in ('matplotlib', 'numpy'):
+    try:
+        importlib.import_module(package)
+    except ImportError:
+        subprocess.check_call([sys.executable, '-m', 'pip', 'install',
+                               '--user', package])
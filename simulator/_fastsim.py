@@ -0,0 +1,78 @@
+"""Module containing fast simulation paths for static schedules.
+
+Static schedules give each resource all of its tasks in a single request,
+so they can be simulated without an event loop.
+"""
+
+import numpy as np  # for arrays
+
+
+def flatten_schedule(schedule):
+    """Joins the tasks given to each resource into arrays.
+
+    Parameters
+    ----------
+    schedule : list of numpy.ndarray or list of int
+        Tasks mapped to each resource
+
+    Returns
+    -------
+    numpy.ndarray of int32, numpy.ndarray of int64
+        Task identifiers of all resources one after the other, and
+        the offset where the tasks of each resource start (plus the
+        total number of tasks at the end)
+    """
+    lengths = [len(group) for group in schedule]
+    offsets = np.zeros(len(schedule) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = np.concatenate([np.asarray(group, dtype=np.int32)
+                           for group in schedule])
+    return flat, offsets
+
+
+def simulate_static(tasks, schedule):
+    """Simulates the execution of a static schedule without an event loop.
+
+    Parameters
+    ----------
+    tasks : list of int or float
+        Contiguous tasks and their loads
+    schedule : list of numpy.ndarray or list of int
+        Tasks given to each resource
+
+    Returns
+    -------
+    numpy.ndarray of int32, int or float, int
+        Mapping of tasks to resources, makespan, number of calls to
+        the scheduler
+
+    Notes
+    -----
+    Each resource receives all of its tasks in a single request, so the
+    order in which resources are served does not change the result and
+    each resource ends at the total load of its tasks.
+    """
+    schedule_flat, offsets = flatten_schedule(schedule)
+    lengths = np.diff(offsets)
+    requests = int(np.count_nonzero(lengths))
+    owners = np.repeat(np.arange(len(schedule), dtype=np.int32), lengths)
+
+    # Adds the loads of each resource in the order of its tasks, as the
+    # event loop does. bincount adds in float64, so it is only used when
+    # all loads are floats; other loads are added exactly as Python numbers
+    if requests and all(isinstance(load, float) for load in tasks):
+        loads = np.asarray(tasks, dtype=np.float64)
+        end_times = np.bincount(owners, weights=loads[schedule_flat],
+                                minlength=len(schedule))
+        makespan = end_times.max().item()
+    else:
+        ordered = [tasks[task_id] for task_id in schedule_flat.tolist()]
+        bounds = offsets.tolist()
+        makespan = max((sum(ordered[start:end])
+                        for start, end in zip(bounds, bounds[1:])),
+                       default=0)
+
+    # Writes the resource of each task with one vectorized scatter
+    mapping = np.full(len(tasks), -1, dtype=np.int32)
+    mapping[schedule_flat] = owners
+    return mapping, makespan, requests
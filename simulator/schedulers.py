@@ -8,6 +8,8 @@ Methods with interfaces but no implementation: OpenMPDynamic, OpenMPGuided,
 RecursiveBipartition.
 """
 
+import numpy as np  # for vectorized schedule computations
+
 
 class Scheduler:
     """
@@ -19,7 +21,15 @@ class Scheduler:
         Algorithm's name
     num_resources : int
         Number of identical resources
+
+    Notes
+    -----
+    Implemented schedulers declare their attributes in __slots__ to
+    reduce their memory footprint. Subclasses without __slots__ can
+    still add any attributes.
     """
+    __slots__ = ('name', 'num_resources')
+
     def __init__(self, num_resources, name='scheduler'):
         self.name = name
         self.num_resources = num_resources
@@ -47,18 +57,33 @@ class OpenMPStatic(Scheduler):
     """
     Static scheduler based on the algorithm used for OpenMP.
 
+    Attributes
+    ----------
+    chunk_size : int
+        Number of contiguous tasks per chunk (0 for a compact mapping)
+    schedule_flat : numpy.ndarray of int32
+        Task identifiers of all resources one after the other
+    offsets : numpy.ndarray of int
+        Offset where the tasks of each resource start in schedule_flat
+        (with the number of tasks at the end)
+    served : list of bool
+        True for resources that already got their tasks
+
     Notes
     -----
     This scheduler requires an additional parameters defining the chunk size.
     Its initialization method pre-computes the schedule.
     """
+    __slots__ = ('chunk_size', 'schedule_flat', 'offsets', 'served')
+
     def __init__(self, tasks, num_resources, chunk_size=0):
         Scheduler.__init__(self, num_resources, name='Static')
         self.chunk_size = chunk_size
 
         # Pre-computes the schedule
-        schedule = [list() for i in range(num_resources)]
         num_tasks = len(tasks)
+        task_ids = np.arange(num_tasks)
+        resources = np.arange(num_resources + 1)
         # Two styles
         # if chunk size == 0, does a compact mapping
         if chunk_size == 0:
@@ -67,36 +92,28 @@ class OpenMPStatic(Scheduler):
             # Number of resources that will have +1 tasks
             leftover = num_tasks % num_resources
 
-            # Starting task identifier
-            task = 0
-
-            # Iterates over the resources mapping groups of tasks to them
-            for resource in range(num_resources):
-                # Sets the actual size of the group of tasks to map
-                # to this resource based on the existence of any leftover
-                if leftover > 0:
-                    group_size = partition_size + 1
-                    leftover -= 1
-                else:  # No more resources with +1 tasks
-                    group_size = partition_size
-
-                for i in range(group_size):
-                    schedule[resource].append(task)
-                    task += 1  # next task to map
+            # The tasks are already in order. The first 'leftover' resources
+            # get +1 tasks, so each offset is shifted by min(resource,
+            # leftover) (no branching)
+            schedule_flat = task_ids.astype(np.int32)
+            offsets = (resources * partition_size +
+                       np.minimum(resources, leftover))
         else:
             # does a round-robin mapping by chunks
-            resource = 0
-            chunk_counter = 0
-            for task in range(num_tasks):
-                schedule[resource].append(task)
-                chunk_counter += 1
-                # if the chunk is full, starts a new one in the next resource
-                if chunk_counter == chunk_size:
-                    chunk_counter = 0
-                    resource = (resource + 1) % num_resources
+            # (task t goes to resource (t // chunk_size) % num_resources)
+            # (chunks larger than the loop are clamped so they fit in intp)
+            chunk = min(chunk_size, max(num_tasks, 1))
+            resource_of = (task_ids // chunk) % num_resources
+            # Buckets tasks by resource keeping their order in each bucket
+            order = np.argsort(resource_of, kind='stable')
+            schedule_flat = order.astype(np.int32)
+            offsets = np.searchsorted(resource_of[order], resources)
 
         # Stores the pre-computed schedule
-        self.schedule = schedule
+        self.schedule_flat = schedule_flat
+        self.offsets = offsets
+        # Marks the resources that already got their tasks
+        self.served = [False] * num_resources
 
     def query(self, resource_id):
         """
@@ -109,14 +126,37 @@ class OpenMPStatic(Scheduler):
 
         Returns
         -------
-        list of int
-            Pre-computed list of task identifiers, or an empty list
+        numpy.ndarray of int32
+            View of the pre-computed task identifiers, or an empty array
+
+        Notes
+        -----
+        The result is always an array, so callers must check if it is empty
+        with len() (the truth value of an array is ambiguous).
         """
-        tasks = self.schedule[resource_id]
-        if tasks:  # if they have not been scheduled before
-            # empties the list
-            self.schedule[resource_id] = []
-        return tasks
+        if self.served[resource_id]:  # if they have been scheduled before
+            return self.schedule_flat[0:0]
+        self.served[resource_id] = True
+        start = self.offsets[resource_id]
+        end = self.offsets[resource_id + 1]
+        return self.schedule_flat[start:end]
+
+    def static_schedule(self):
+        """
+        Provides the tasks of all resources at once.
+
+        Returns
+        -------
+        list of numpy.ndarray of int32
+            Tasks that query gives to each resource (empty for resources
+            that have been served before)
+
+        Notes
+        -----
+        The simulator uses this method instead of querying the resources
+        one event at a time. Every resource is marked as served.
+        """
+        return [self.query(res_id) for res_id in range(self.num_resources)]
 
 
 class LPT(Scheduler):
@@ -126,14 +166,19 @@ class LPT(Scheduler):
     Notes
     -----
     Its initialization creates an internal list of tasks ordered by load.
+    Tasks with the same load are ordered by non-increasing identifier.
     """
+    __slots__ = ('tasks', 'next_task')
+
     def __init__(self, tasks, num_resources):
         Scheduler.__init__(self, num_resources, name='LPT')
-        num_tasks = len(tasks)
-        # Orders tasks by non-increasing load
-        tasks_by_priority = [(tasks[i], i) for i in range(num_tasks)]
-        tasks_by_priority.sort(reverse=True)
-        self.tasks = tasks_by_priority
+        # Orders tasks by non-increasing load (reversing a stable sort
+        # puts tasks with the same load in non-increasing identifier order)
+        loads = np.asarray(tasks)
+        order = np.argsort(loads, kind='stable')[::-1]
+        self.tasks = order.tolist()
+        # Position of the next task to schedule (avoids an O(n) pop(0))
+        self.next_task = 0
 
     def query(self, resource_id):
         """
@@ -149,12 +194,32 @@ class LPT(Scheduler):
         list of int
             List with one task identifier
         """
-        if self.tasks:
-            load, task_id = self.tasks.pop(0)
+        if self.next_task < len(self.tasks):
+            task_id = self.tasks[self.next_task]
+            self.next_task += 1
             return [task_id]
         else:  # nothing to return
             return []
 
+    def remaining_order(self):
+        """
+        Provides all the tasks that query has not given yet.
+
+        Returns
+        -------
+        list of int
+            Task identifiers in the order in which query would give them
+
+        Notes
+        -----
+        The simulator uses this method instead of querying the resources
+        one task at a time, so it must follow the same order as query.
+        The tasks are marked as given.
+        """
+        order = self.tasks[self.next_task:]
+        self.next_task = len(self.tasks)
+        return order
+
 
 class OpenMPDynamic(Scheduler):
     """
@@ -5,6 +5,8 @@ computes how the system would execute given the behavior of the scheduler.
 """
 
 import heapq   # for heaps (it implements only min-heaps)
+import numpy as np  # for vectorized metrics
+from simulator import _fastsim
 
 
 def simulate(tasks, num_resources, scheduler, debug=False):
@@ -19,24 +21,37 @@ def simulate(tasks, num_resources, scheduler, debug=False):
     scheduler : Scheduler object
         Scheduling algorithm to be used for the simulation
     debug : bool [default = False]
-        True if debug messages should be printed
+        True if debug messages (including the makespan) should be printed
 
     Returns
     -------
-    list of int, int or float, int, int
+    numpy.ndarray of int32, int or float, int, int
         Mapping of tasks to resources, makespan, number of calls to
         the scheduler, number of resource changes between contiguous
         tasks
     """
-    print('* Starting the simulation *')
     if debug:
+        print('* Starting the simulation *')
         print(f'- {len(tasks)} tasks running on' +
               f' {num_resources} resources using the' +
               f' {scheduler} scheduler.')
 
+    # Schedulers with a known behavior can be simulated by a specialized
+    # version of the engine that does not call the scheduler for each event
+    # (only when there are no debug messages to print for each event)
+    specialized = _specialized_simulation(scheduler)
+    if specialized is not None and not debug:
+        return _finalize(*specialized(tasks, num_resources, scheduler))
+
     # Setup:
-    # - Creates a heap of free resources
-    resources = [(0, i) for i in range(num_resources)]
+    # - Creates a heap of free resources. With integer loads, the heap holds
+    #   (time, id) packed in one int
+    shift = _packing_shift(tasks, num_resources)
+    if shift is None:
+        resources = [(0, i) for i in range(num_resources)]
+    else:
+        mask = (1 << shift) - 1
+        resources = list(range(num_resources))  # time 0 for all
     # - Creates a structure for storing where tasks are mapped
     mapping = [-1] * len(tasks)
     # - Counter of successful requests to the scheduler
@@ -50,9 +65,16 @@ def simulate(tasks, num_resources, scheduler, debug=False):
     # 4. if we get an empty list, the resource is considered to be done
     while resources:
         # Step 1
-        time, res_id = heapq.heappop(resources)
+        if shift is not None:
+            key = heapq.heappop(resources)
+            time, res_id = key >> shift, key & mask
+        else:
+            time, res_id = heapq.heappop(resources)
         # Step 2
         new_tasks = scheduler.query(res_id)
+        if isinstance(new_tasks, np.ndarray):
+            # Python ints are faster to handle one by one
+            new_tasks = new_tasks.tolist()
         if new_tasks:
             # Step 3
             if debug:
@@ -64,25 +86,189 @@ def simulate(tasks, num_resources, scheduler, debug=False):
                 if mapping[task_id] != -1:
                     print(f'- Error. Task {task_id} has already been scheduled' +
                           f' to resource {mapping[task_id]}. Stopping.')
-                    return ([], -1, -1 , -1)
+                    return (np.array([], dtype=np.int32), -1, -1, -1)
 
                 # Sets the mapping of the task and adds its load to the resource
                 mapping[task_id] = res_id
                 extra_time += tasks[task_id]
             # puts the resource back in the heap
-            heapq.heappush(resources, (time + extra_time, res_id))
+            if shift is not None:
+                heapq.heappush(resources, key + (extra_time << shift))
+            else:
+                heapq.heappush(resources, (time + extra_time, res_id))
 
         else:
             # Step 4
             if debug:
                 print(f'[{time}] - Resource {res_id} is done.')
 
+    # No more events
+    if debug:
+        print(f'* Total execution time (makespan) = {time}\n')
+    return _finalize(mapping, time, requests)
+
+
+def _simulate_static(tasks, num_resources, scheduler):
+    """Specialized simulation for static schedulers (e.g., OpenMPStatic).
+
+    Parameters
+    ----------
+    tasks : list of int or float
+        Contiguous tasks and their loads
+    num_resources : int
+        Number of identical resources to simulate
+    scheduler : Scheduler object
+        Scheduler with a static_schedule method
+
+    Returns
+    -------
+    numpy.ndarray of int32, int or float, int
+        Mapping of tasks to resources, makespan, number of calls to
+        the scheduler
+
+    Notes
+    -----
+    Resources end at the load of their tasks in 'tasks', which may differ
+    from the loads used to build the schedule. Resources that were served
+    before get nothing, as in the regular engine.
+    """
+    # (only the simulated resources take part in the simulation)
+    schedule = scheduler.static_schedule()[:num_resources]
+    return _fastsim.simulate_static(tasks, schedule)
+
+
+def _simulate_lpt(tasks, num_resources, scheduler):
+    """Specialized simulation for schedulers with a fixed order (e.g., LPT).
+
+    Parameters
+    ----------
+    tasks : list of int or float
+        Contiguous tasks and their loads
+    num_resources : int
+        Number of identical resources to simulate
+    scheduler : Scheduler object
+        Scheduler with a remaining_order method
+
+    Returns
+    -------
+    list of int, int or float, int
+        Mapping of tasks to resources, makespan, number of calls to
+        the scheduler
+
+    Notes
+    -----
+    LPT gives one task per request in a pre-computed order, so the next
+    free resource simply gets the next task of that order. Resources are
+    picked in the same way as in the regular engine.
+    """
+    # Takes the remaining tasks from the scheduler
+    order = scheduler.remaining_order()
+
+    mapping = [-1] * len(tasks)
+    shift = _packing_shift(tasks, num_resources)
+    if shift is not None:
+        # The heap holds (time, id) packed in one int (see _packing_shift)
+        mask = (1 << shift) - 1
+        resources = list(range(num_resources))  # time 0 for all
+        for task_id in order:
+            mapping[task_id] = resources[0] & mask
+            heapq.heapreplace(resources,
+                              resources[0] + (tasks[task_id] << shift))
+        makespan = max(resources) >> shift
+    else:
+        resources = [(0, i) for i in range(num_resources)]
+        for task_id in order:
+            time, res_id = resources[0]
+            mapping[task_id] = res_id
+            heapq.heapreplace(resources, (time + tasks[task_id], res_id))
+        makespan = max(resources)[0]
+    return mapping, makespan, len(order)
+
+
+def _packing_shift(tasks, num_resources):
+    """Checks if resource times and ids can be packed in single integers.
+
+    Parameters
+    ----------
+    tasks : list of int or float
+        Contiguous tasks and their loads
+    num_resources : int
+        Number of identical resources to simulate
+
+    Returns
+    -------
+    int or None
+        Number of bits to shift a time to the left before adding a resource
+        id to it, or None if the loads are not all integers
+
+    Notes
+    -----
+    A packed key (time << shift) + id orders like the tuple (time, id), so
+    heaps of keys break ties in the same way as heaps of tuples, but they
+    compare single integers instead of tuples.
+    Adding (load << shift) to a key adds the load to its time.
+    """
+    if set(map(type, tasks)) <= {int}:
+        return num_resources.bit_length()
+    return None
+
+
+def _finalize(mapping, makespan, requests):
+    """Computes the locality of a mapping.
+
+    Parameters
+    ----------
+    mapping : list of int or numpy.ndarray of int32
+        Mapping of tasks to resources
+    makespan : int or float
+        Total execution time
+    requests : int
+        Number of calls to the scheduler
+
+    Returns
+    -------
+    numpy.ndarray of int32, int or float, int, int
+        Mapping of tasks to resources, makespan, number of calls to
+        the scheduler, number of resource changes between contiguous
+        tasks
+    """
     # Computes the number of resource changes between contiguous resources
-    contig_changes = 0
-    for i in range(0, len(tasks)-1):
-        if mapping[i] != mapping[i+1]:
-            contig_changes += 1
+    mapping = np.asarray(mapping, dtype=np.int32)
+    contig_changes = int(np.count_nonzero(mapping[1:] != mapping[:-1]))
 
-    # No more events
-    print(f'* Total execution time (makespan) = {time}\n')
-    return (mapping, time, requests, contig_changes)
+    return (mapping, makespan, requests, contig_changes)
+
+
+def _specialized_simulation(scheduler):
+    """Finds a specialized simulation for a scheduler.
+
+    Parameters
+    ----------
+    scheduler : Scheduler object
+        Scheduling algorithm to be used for the simulation
+
+    Returns
+    -------
+    function or None
+        Specialized simulation, or None if the scheduler has to go through
+        the event loop
+
+    Notes
+    -----
+    Only classes that define one of the methods in SPECIALIZED_SIMULATIONS
+    themselves are specialized. Subclasses that inherit it (and may change
+    query) go through the event loop.
+    """
+    methods = vars(type(scheduler))
+    for method, specialized in SPECIALIZED_SIMULATIONS.items():
+        if method in methods:
+            return specialized
+    return None
+
+
+# Specialized simulations for schedulers whose behavior is known in advance,
+# indexed by the method that gives the tasks the scheduler will hand out
+SPECIALIZED_SIMULATIONS = {
+    'static_schedule': _simulate_static,
+    'remaining_order': _simulate_lpt,
+}
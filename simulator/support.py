@@ -2,6 +2,7 @@
 
 import random                    # for random numbers
 import statistics                # for metrics
+import numpy as np               # for arrays
 import matplotlib.pyplot as plt  # for plotting
 
 
@@ -42,7 +43,7 @@ def evaluate_mapping(
 
     Parameters
     ----------
-    mapping : list of int
+    mapping : list of int or numpy.ndarray of int
         Mapping of tasks to resources
     task_loads : list of int or float
         Load of the tasks
@@ -56,6 +57,11 @@ def evaluate_mapping(
     list of int or float
         Load of the resources
 
+    Raises
+    ------
+    ValueError
+        If the mapping does not have one valid resource per task
+
     Notes
     -----
     List of metrics:
@@ -69,12 +75,29 @@ def evaluate_mapping(
     # Number of tasks
     num_tasks = len(task_loads)
     # Computes the load per resource (and the number of tasks per resource)
-    resource_loads = [0] * num_resources
-    tasks_per_resource = [0] * num_resources
-    for task in range(num_tasks):
-        resource = mapping[task]
-        resource_loads[resource] += task_loads[task]
-        tasks_per_resource[resource] += 1
+    # with one pass over the mapping each
+    mapping = np.asarray(mapping, dtype=np.intp)
+    # Checks that every task is mapped to an existing resource
+    if len(mapping) != num_tasks:
+        raise ValueError(f'The mapping has {len(mapping)} entries for'
+                         f' {num_tasks} tasks.')
+    invalid = (mapping < 0) | (mapping >= num_resources)
+    if invalid.any():
+        task = int(invalid.argmax())
+        raise ValueError(f'Task {task} is mapped to resource'
+                         f' {mapping[task]}, which is not in'
+                         f' [0, {num_resources}).')
+    if num_tasks and all(isinstance(load, float) for load in task_loads):
+        resource_loads = np.bincount(mapping, weights=task_loads,
+                                     minlength=num_resources).tolist()
+    else:
+        # bincount adds in float64, so other loads are added exactly
+        # as Python numbers
+        resource_loads = [0] * num_resources
+        for resource, load in zip(mapping.tolist(), task_loads):
+            resource_loads[resource] += load
+    tasks_per_resource = np.bincount(mapping,
+                                     minlength=num_resources).tolist()
 
     # Prints information if verbose
     if verbose:
@@ -90,7 +113,7 @@ def evaluate_mapping(
         print(f'- Number of tasks: {num_tasks}')
         print(f'- Number of resources: {num_resources}')
         print(f'- Task loads: {task_loads}')
-        print(f'- Task mapping: {mapping}')
+        print(f'- Task mapping: {mapping.tolist()}')
         print(f'- Tasks per resource: {tasks_per_resource}')
         print(f'- Resource loads: {resource_loads}')
         print(f'* Metrics *')
@@ -114,7 +137,7 @@ def plot_mapping(
 
     Parameters
     ----------
-    mapping : list of int
+    mapping : list of int or numpy.ndarray of int
         Mapping of tasks to resources
     task_loads : list of int or float
         Load of the tasks
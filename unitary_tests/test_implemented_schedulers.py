@@ -2,6 +2,7 @@
 
 import unittest
 import sys
+import numpy as np
 # Add the parent directory to the path so we can import
 # code from our simulator
 sys.path.append('../')
@@ -9,6 +10,23 @@ sys.path.append('../')
 from simulator.schedulers import OpenMPStatic, LPT
 from simulator.simulator import simulate
 
+
+# Subclasses are not specialized by the simulator, so they always go
+# through its event loop
+class EventLoopStatic(OpenMPStatic):
+    pass
+
+
+class EventLoopLPT(LPT):
+    pass
+
+
+class RepeatedTask(LPT):
+    # Gives task 0 to every request
+    def query(self, resource_id):
+        return [0]
+
+
 class OpenMPStaticTest(unittest.TestCase):
     def setUp(self):
         self.tasks = [2, 4, 6, 8, 5, 3, 9, 2, 4, 6]
@@ -54,6 +72,85 @@ class OpenMPStaticTest(unittest.TestCase):
         self.assertEqual(mapping[8], 1)
         self.assertEqual(mapping[9], 1)
 
+    def test_many_resources(self):
+        # More resources than tasks, with the specialized simulation and
+        # with the event loop
+        num_resources = 100
+        for scheduler in (OpenMPStatic, EventLoopStatic):
+            static = scheduler(self.tasks, num_resources, 1)
+            result = simulate(self.tasks, num_resources, static)
+            mapping = result[0]
+
+            self.assertEqual(result[1], 9)
+            self.assertEqual(result[2], 10)
+            self.assertEqual(result[3], 9)
+
+            for task in range(len(self.tasks)):
+                self.assertEqual(mapping[task], task)
+
+    def test_huge_chunk(self):
+        # Chunks larger than the loop give all tasks to the first resource
+        for chunk_size in (2**31, 2**70):
+            static = OpenMPStatic(self.tasks, self.num_resources, chunk_size)
+            result = simulate(self.tasks, self.num_resources, static)
+            self.assertEqual(result[0].tolist(), [0] * len(self.tasks))
+            self.assertEqual(result[1], sum(self.tasks))
+
+    def test_query_once(self):
+        # Each resource gets its tasks once, then an empty array
+        static = OpenMPStatic(self.tasks, self.num_resources, 1)
+        self.assertEqual(static.query(0).tolist(), [0, 3, 6, 9])
+        self.assertEqual(len(static.query(0)), 0)
+        self.assertEqual(type(static.query(0)), type(static.query(1)))
+
+    def test_static_schedule(self):
+        # The whole schedule is given as query would give it
+        static = OpenMPStatic(self.tasks, self.num_resources, 1)
+        static.query(1)
+        schedule = static.static_schedule()
+        self.assertEqual([group.tolist() for group in schedule],
+                         [[0, 3, 6, 9], [], [2, 5, 8]])
+        self.assertEqual(len(static.query(0)), 0)
+
+    def test_specialized_matches_event_loop(self):
+        # The specialized static simulation gives the same results as
+        # the event loop
+        for chunk_size, makespan, expected in (
+                (0, 20, [0, 0, 0, 0, 1, 1, 1, 2, 2, 2]),
+                (1, 25, [0, 1, 2, 0, 1, 2, 0, 1, 2, 0]),
+                (2, 24, [0, 0, 1, 1, 2, 2, 0, 0, 1, 1])):
+            for cls in (OpenMPStatic, EventLoopStatic):
+                static = cls(self.tasks, self.num_resources, chunk_size)
+                result = simulate(self.tasks, self.num_resources, static)
+                self.assertEqual(result[0].tolist(), expected)
+                self.assertEqual(result[1], makespan)
+                self.assertEqual(result[2], 3)
+
+    def test_different_loads(self):
+        # The schedule is built from estimated loads, but the simulation
+        # uses the actual ones
+        estimated = [1, 1, 1, 1, 1, 1]
+        actual = [1, 1, 1, 1, 1, 10]
+        for debug in (False, True):
+            static = OpenMPStatic(estimated, 2, 0)
+            result = simulate(actual, 2, static, debug)
+
+            self.assertEqual(result[1], 12)
+            self.assertEqual(result[2], 2)
+            self.assertEqual(result[3], 1)
+
+    def test_exact_integer_loads(self):
+        # Integer loads are added exactly, as in the event loop, and
+        # no tasks give an integer makespan
+        for tasks, makespan in (([2**53 + 1, 2**53 + 1, 1], 2**54 + 3),
+                                ([2**70, 3], 2**70 + 3),
+                                ([], 0)):
+            for debug in (False, True):
+                static = OpenMPStatic(tasks, 1, 0)
+                result = simulate(tasks, 1, static, debug)
+                self.assertEqual(result[1], makespan)
+                self.assertIs(type(result[1]), int)
+
 
 class LPTTest(unittest.TestCase):
     def setUp(self):
@@ -80,6 +177,84 @@ class LPTTest(unittest.TestCase):
         self.assertEqual(mapping[8], 0)
         self.assertEqual(mapping[9], 2)
 
+    def test_equal_loads(self):
+        # Tasks with the same load are scheduled from the last to the first
+        tasks = [3, 3, 3, 3]
+        lpt = LPT(tasks, 2)
+        result = simulate(tasks, 2, lpt)
+        mapping = result[0]
+
+        self.assertEqual(result[1], 6)
+        self.assertEqual(result[2], 4)
+        self.assertEqual(result[3], 3)
+
+        self.assertEqual(mapping[0], 1)
+        self.assertEqual(mapping[1], 0)
+        self.assertEqual(mapping[2], 1)
+        self.assertEqual(mapping[3], 0)
+
+    def test_specialized_matches_event_loop(self):
+        # The specialized LPT simulation gives the same results as the
+        # event loop on a heap of resources
+        num_resources = 100
+        int_tasks = [(i * 7) % 11 + 1 for i in range(500)]
+        float_tasks = [load / 4 for load in int_tasks]
+        for tasks in (int_tasks, float_tasks):
+            specialized = simulate(tasks, num_resources,
+                                   LPT(tasks, num_resources))
+            event_loop = simulate(tasks, num_resources,
+                                  EventLoopLPT(tasks, num_resources))
+
+            self.assertEqual(specialized[0].tolist(), event_loop[0].tolist())
+            self.assertEqual(specialized[1:], event_loop[1:])
+
+    def test_remaining_order(self):
+        # The remaining tasks are given in the same order as query
+        lpt = LPT(self.tasks, self.num_resources)
+        first = lpt.query(0)
+        reference = LPT(self.tasks, self.num_resources)
+        expected = [reference.query(0)[0] for _ in self.tasks]
+        self.assertEqual(first + lpt.remaining_order(), expected)
+        self.assertEqual(lpt.query(0), [])
+
+    def test_repeated_task(self):
+        # A task scheduled twice stops the simulation
+        tasks = [1, 2]
+        result = simulate(tasks, 2, RepeatedTask(tasks, 2))
+
+        self.assertEqual(result[0].dtype, np.int32)
+        self.assertEqual(len(result[0]), 0)
+        self.assertEqual(result[1:], (-1, -1, -1))
+
+    def check_ties(self, load):
+        # 150 tasks with the same load on 100 resources: tasks 149 to 50 go
+        # to resources 0 to 99, then tasks 49 to 0 go to resources 0 to 49
+        # (ties between resources go to the lowest identifier)
+        num_resources = 100
+        tasks = [load] * 150
+        for scheduler in (LPT, EventLoopLPT):
+            lpt = scheduler(tasks, num_resources)
+            result = simulate(tasks, num_resources, lpt)
+            mapping = result[0]
+
+            self.assertEqual(result[1], 2 * load)
+            self.assertIs(type(result[1]), type(load))
+            self.assertEqual(result[2], 150)
+            self.assertEqual(result[3], 149)
+
+            for task in range(50):
+                self.assertEqual(mapping[task], 49 - task)
+            for task in range(50, 150):
+                self.assertEqual(mapping[task], 149 - task)
+
+    def test_ties_integer_loads(self):
+        # Integer loads use heap keys packing times and resource ids
+        self.check_ties(2)
+
+    def test_ties_float_loads(self):
+        # Float loads use heap tuples
+        self.check_ties(2.5)
+
 
 if __name__ == '__main__':
     unittest.main()
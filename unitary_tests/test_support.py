@@ -50,6 +50,30 @@ class EMTest(unittest.TestCase):
         self.assertEqual(resource_loads[3], 19)
         self.assertEqual(resource_loads[4], 0)
 
+    def test_invalid_mappings(self):
+        task_loads = [1, 2, 3]
+        # Unmapped task
+        with self.assertRaises(ValueError):
+            evaluate_mapping([0, -1, 1], task_loads, 2, False)
+        # Resource that does not exist
+        with self.assertRaises(ValueError):
+            evaluate_mapping([0, 2, 1], task_loads, 2, False)
+        # Empty mapping (e.g., after a simulation error)
+        with self.assertRaises(ValueError):
+            evaluate_mapping([], task_loads, 2, False)
+
+    def test_exact_loads(self):
+        # Integer loads are added exactly and mixed loads keep their types
+        task_loads = [2**53 + 1, 2**53 + 1, 1]
+        self.assertEqual(evaluate_mapping([0, 0, 0], task_loads, 1, False),
+                         [2**54 + 3])
+        task_loads = [2**70, 3]
+        self.assertEqual(evaluate_mapping([0, 0], task_loads, 1, False),
+                         [2**70 + 3])
+        resource_loads = evaluate_mapping([0, 1], [1, 2.5], 2, False)
+        self.assertEqual(resource_loads, [1, 2.5])
+        self.assertIs(type(resource_loads[0]), int)
+
 
 if __name__ == '__main__':
     unittest.main()